@@ -6,20 +6,59 @@ This script handles install/update/delete operations for the OpenAI plugin
 using the new multi-user plugin lifecycle management architecture.
 """
 
+from __future__ import annotations
+
 import json
 import logging
 import datetime
+import functools
+import hashlib
+import itertools
 import os
 import shutil
 import asyncio
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
 from sqlalchemy import text
+from sqlalchemy.engine import make_url
 import structlog
 
+if TYPE_CHECKING:
+    # Only needed for annotations; importing the asyncio extension at runtime
+    # pulls in greenlet and the async engine machinery
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 logger = structlog.get_logger()
 
+# Prefer orjson for JSON encoding/decoding when it is installed
+try:
+    import orjson
+
+    def _json_dumps(value: Any) -> str:
+        return orjson.dumps(value).decode()
+
+    def _json_dumps_config(value: Any) -> str:
+        # User configs may carry non-string keys or datetimes; encode both natively
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_dumps = json.dumps
+    _json_dumps_config = json.dumps
+    _json_loads = json.loads
+
+
+def _load_config_field(value: Any) -> Any:
+    """Decode a non-empty stored config column, returning {} if it cannot be decoded"""
+    try:
+        return _json_loads(value)
+    except (ValueError, TypeError):
+        return {}
+
+
 # Import the new base lifecycle manager
 try:
     # Try to import from the BrainDrive system first (when running in production)
@@ -92,9 +131,185 @@ except ImportError:
         raise ImportError("OpenAI plugin requires the new architecture BaseLifecycleManager")
 
 
+# Existing plugin lookup for a user
+_PLUGIN_EXISTS_SELECT = text("""
+SELECT id, name, version, enabled, created_at, updated_at
+FROM plugin
+WHERE user_id = :user_id AND plugin_slug = :plugin_slug
+""")
+
+# Plugin record creation
+_PLUGIN_INSERT = text("""
+INSERT INTO plugin
+(id, name, description, version, type, enabled, icon, category, status,
+official, author, last_updated, compatibility, downloads, scope,
+bundle_method, bundle_location, is_local, long_description,
+config_fields, messages, dependencies, created_at, updated_at, user_id,
+plugin_slug, source_type, source_url, update_check_url, last_update_check,
+update_available, latest_version, installation_type, permissions)
+VALUES
+(:id, :name, :description, :version, :type, :enabled, :icon, :category,
+:status, :official, :author, :last_updated, :compatibility, :downloads,
+:scope, :bundle_method, :bundle_location, :is_local, :long_description,
+:config_fields, :messages, :dependencies, :created_at, :updated_at, :user_id,
+:plugin_slug, :source_type, :source_url, :update_check_url, :last_update_check,
+:update_available, :latest_version, :installation_type, :permissions)
+""")
+
+# Module record creation (executemany)
+_MODULE_INSERT = text("""
+INSERT INTO module
+(id, plugin_id, name, display_name, description, icon, category,
+enabled, priority, props, config_fields, messages, required_services,
+dependencies, layout, tags, created_at, updated_at, user_id)
+VALUES
+(:id, :plugin_id, :name, :display_name, :description, :icon, :category,
+:enabled, :priority, :props, :config_fields, :messages, :required_services,
+:dependencies, :layout, :tags, :created_at, :updated_at, :user_id)
+""")
+
+# Module record deletion
+_MODULE_DELETE = text("""
+DELETE FROM module
+WHERE plugin_id = :plugin_id AND user_id = :user_id
+""")
+
+# Plugin record deletion
+_PLUGIN_DELETE = text("""
+DELETE FROM plugin
+WHERE id = :plugin_id AND user_id = :user_id
+""")
+
+# PostgreSQL: delete a user's plugin by slug and its modules, returning the plugin id
+_USER_PLUGIN_DELETE_RETURNING = text("""
+WITH deleted_plugin AS (
+    DELETE FROM plugin
+    WHERE user_id = :user_id AND plugin_slug = :plugin_slug
+    RETURNING id
+), deleted_modules AS (
+    DELETE FROM module
+    WHERE user_id = :user_id AND plugin_id IN (SELECT id FROM deleted_plugin)
+    RETURNING 1
+)
+SELECT id, (SELECT count(*) FROM deleted_modules) AS deleted_modules
+FROM deleted_plugin
+""")
+
+# Plugin configuration restore after an update
+_PLUGIN_CONFIG_UPDATE = text("""
+UPDATE plugin SET config_fields = :config_fields
+WHERE id = :plugin_id AND user_id = :user_id
+""")
+
+# Statement for exporting plugin and module configurations before an update
+_USER_CONFIG_EXPORT = text("""
+SELECT p.config_fields AS plugin_config, m.name AS module_name, m.config_fields AS module_config
+FROM plugin p
+LEFT JOIN module m ON m.plugin_id = p.id AND m.user_id = p.user_id
+WHERE p.user_id = :user_id AND p.plugin_slug = :plugin_slug
+""")
+
+# Statement for restoring module configurations after an update
+_MODULE_CONFIG_UPDATE = text("""
+UPDATE module SET config_fields = :config_fields
+WHERE id = :module_id AND user_id = :user_id
+""")
+
+# Plugin source directory and the default backend shared storage root
+_HERE = Path(__file__).parent
+_DEFAULT_SHARED_ROOT = _HERE.parent.parent / "backend" / "plugins" / "shared"
+
+# Read buffer size for hashing files when hashlib.file_digest is unavailable
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def _new_digest():
+    """Create the hash object used for plugin file digests"""
+    return hashlib.blake2b(digest_size=16)
+
+
+def _file_digest(path: Path) -> bytes:
+    """Return a 128-bit BLAKE2b digest of a file's contents"""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: streams into a reusable buffer in C
+            return hashlib.file_digest(f, _new_digest).digest()
+        digest = _new_digest()
+        for chunk in iter(lambda: f.read(COPY_BUFFER_SIZE), b''):
+            digest.update(chunk)
+        return digest.digest()
+
+
+def _needs_copy(src: Path, dst: Path) -> bool:
+    """Check whether dst is missing or differs from src"""
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        return True
+    if os.stat(src).st_size != dst_stat.st_size:
+        return True
+    return _file_digest(src) != _file_digest(dst)
+
+
+def _copy_if_changed(src: Path, dst: Path) -> bool:
+    """Copy src to dst unless dst already has identical contents; return True if copied"""
+    if not _needs_copy(src, dst):
+        return False
+    # copy2 uses the platform fast-copy path where it applies and falls back otherwise
+    shutil.copy2(src, dst)
+    return True
+
+
 class OpenAILifecycleManager(BaseLifecycleManager):
     """Lifecycle manager for OpenAI plugin using new architecture"""
 
+    # Names never copied into plugin storage (similar to build_archive.py)
+    EXCLUDE_EXACT = frozenset({
+        'node_modules',
+        'package-lock.json',
+        '.git',
+        '.gitignore',
+        '__pycache__',
+        '.DS_Store',
+        'Thumbs.db'
+    })
+
+    # Wildcard exclusions ('*.pyc'), as suffixes for a single str.endswith check
+    EXCLUDE_SUFFIXES = ('.pyc',)
+
+    # Seconds a _check_existing_plugin result is reused before querying again.
+    # The cache is per manager instance and is only invalidated by this
+    # instance's own inserts and deletes; changes made through another manager
+    # or process stay invisible for up to this long. Module-level helpers share
+    # one manager per plugins directory (_get_manager), so its cache and
+    # active_users live for the whole process.
+    EXISTS_CACHE_TTL = 5.0
+    # Most recently used users kept in the existence cache
+    EXISTS_CACHE_MAX_ENTRIES = 1024
+
+    # Composite indexes matching the plugin/module lookups issued by this manager.
+    # The host application owns the schema, so these are recommendations for its
+    # migrations (see README); they are never executed here.
+    DATABASE_INDEXES = (
+        "CREATE INDEX IF NOT EXISTS ix_plugin_user_slug ON plugin (user_id, plugin_slug)",
+        "CREATE INDEX IF NOT EXISTS ix_module_plugin_user ON module (plugin_id, user_id)"
+    )
+
+    # Only every Nth health poll is logged
+    HEALTH_LOG_SAMPLE_RATE = 100
+
+    # Pool settings applied by configure_engine for PostgreSQL engines
+    ENGINE_POOL_DEFAULTS = {
+        'pool_size': 20,
+        'max_overflow': 10,
+        'pool_pre_ping': True,
+        'pool_recycle': 3600
+    }
+
+    # Async PostgreSQL drivers configure_engine keeps; any other PostgreSQL
+    # driver (the default, psycopg2, pg8000, ...) is replaced with asyncpg
+    ASYNC_POSTGRESQL_DRIVERS = frozenset({'asyncpg', 'psycopg', 'psycopg_async'})
+
     def __init__(self, plugins_base_dir: str = None):
         """Initialize the lifecycle manager"""
         # Define plugin-specific data
@@ -205,11 +420,36 @@ class OpenAILifecycleManager(BaseLifecycleManager):
             }
         ]
 
+        # plugin_data is never mutated after construction, so build the info once
+        self._plugin_info = {
+            'name': self.plugin_data['name'],
+            'version': self.plugin_data['version'],
+            'description': self.plugin_data['description'],
+            'author': self.plugin_data['author'],
+            'plugin_slug': self.plugin_data['plugin_slug'],
+            'type': self.plugin_data['type'],
+            'category': self.plugin_data['category']
+        }
+
+        # Serialize the static JSON columns once instead of on every installation
+        self._permissions_json = _json_dumps(self.plugin_data['permissions'])
+        self._module_serialized = [
+            {
+                **module_data,
+                'props_json': _json_dumps(module_data['props']),
+                'config_fields_json': _json_dumps(module_data['config_fields']),
+                'messages_json': _json_dumps(module_data['messages']),
+                'required_services_json': _json_dumps(module_data['required_services']),
+                'dependencies_json': _json_dumps(module_data['dependencies']),
+                'layout_json': _json_dumps(module_data['layout']),
+                'tags_json': _json_dumps(module_data['tags'])
+            }
+            for module_data in self.module_data
+        ]
+
         # Initialize base class with required parameters
-        if plugins_base_dir:
-            shared_path = Path(plugins_base_dir) / "shared" / self.plugin_data['plugin_slug'] / f"v{self.plugin_data['version']}"
-        else:
-            shared_path = Path(__file__).parent.parent.parent / "backend" / "plugins" / "shared" / self.plugin_data['plugin_slug'] / f"v{self.plugin_data['version']}"
+        shared_root = Path(plugins_base_dir) / "shared" if plugins_base_dir else _DEFAULT_SHARED_ROOT
+        shared_path = shared_root / self.plugin_data['plugin_slug'] / f"v{self.plugin_data['version']}"
 
         super().__init__(
             plugin_slug=self.plugin_data['plugin_slug'],
@@ -217,6 +457,30 @@ class OpenAILifecycleManager(BaseLifecycleManager):
             shared_storage_path=shared_path
         )
 
+        # (user_id, plugin_slug) -> (monotonic timestamp, _check_existing_plugin result)
+        # kept in least-recently-used order and bounded by EXISTS_CACHE_MAX_ENTRIES
+        self._exists_cache: OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = OrderedDict()
+
+        # package.json path -> ((st_mtime_ns, st_size), parsed contents)
+        self._package_json_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+        # plugin directory -> (file stat signature, _get_plugin_health_impl result)
+        self._health_cache: Dict[Path, Tuple[tuple, Dict[str, Any]]] = {}
+        self._health_poll_counter = itertools.count()
+        # bundle path -> ((st_mtime_ns, st_size), hex digest)
+        self._bundle_digest_cache: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+
+        # Fixed fields of the minimal export returned when _export_user_data fails;
+        # the config dicts are created per call so callers never share them
+        self._fallback_export_template = {
+            'shared_plugin_path': self.shared_path,
+            'plugin_slug': self.plugin_slug,
+            'version': self.version
+        }
+
+        # Bind plugin context once instead of prefixing every message
+        self.log = logger.bind(plugin=self.plugin_data['plugin_slug'], version=self.plugin_data['version'])
+
     @property
     def PLUGIN_DATA(self):
         """Compatibility property for remote installer validation"""
@@ -238,7 +502,7 @@ class OpenAILifecycleManager(BaseLifecycleManager):
             if not db_result['success']:
                 return db_result
 
-            logger.info(f"OpenAIPlugin: User installation completed for {user_id}")
+            self.log.info("user_installation_completed", user_id=user_id)
             return {
                 'success': True,
                 'plugin_id': db_result['plugin_id'],
@@ -246,25 +510,33 @@ class OpenAILifecycleManager(BaseLifecycleManager):
             }
 
         except Exception as e:
-            logger.error(f"OpenAIPlugin: User installation failed for {user_id}: {e}")
+            self.log.error("user_installation_failed", user_id=user_id, error=str(e))
             return {'success': False, 'error': str(e)}
 
     async def _perform_user_uninstallation(self, user_id: str, db: AsyncSession) -> Dict[str, Any]:
         """Perform user-specific uninstallation"""
         try:
-            # Check if plugin exists for user
-            existing_check = await self._check_existing_plugin(user_id, db)
-            if not existing_check['exists']:
-                return {'success': False, 'error': 'Plugin not found for user'}
+            if self._dialect_name(db) == 'postgresql':
+                # Look up and delete the records in one statement
+                delete_result = await self._delete_user_plugin_records(user_id, db)
+                if not delete_result['success']:
+                    return delete_result
 
-            plugin_id = existing_check['plugin_id']
+                plugin_id = delete_result['plugin_id']
+            else:
+                # Check if plugin exists for user
+                existing_check = await self._check_existing_plugin(user_id, db)
+                if not existing_check['exists']:
+                    return {'success': False, 'error': 'Plugin not found for user'}
+
+                plugin_id = existing_check['plugin_id']
 
-            # Delete database records
-            delete_result = await self._delete_database_records(user_id, plugin_id, db)
-            if not delete_result['success']:
-                return delete_result
+                # Delete database records
+                delete_result = await self._delete_database_records(user_id, plugin_id, db)
+                if not delete_result['success']:
+                    return delete_result
 
-            logger.info(f"OpenAIPlugin: User uninstallation completed for {user_id}")
+            self.log.info("user_uninstallation_completed", user_id=user_id)
             return {
                 'success': True,
                 'plugin_id': plugin_id,
@@ -272,7 +544,7 @@ class OpenAILifecycleManager(BaseLifecycleManager):
             }
 
         except Exception as e:
-            logger.error(f"OpenAIPlugin: User uninstallation failed for {user_id}: {e}")
+            self.log.error("user_uninstallation_failed", user_id=user_id, error=str(e))
             return {'success': False, 'error': str(e)}
 
     async def _copy_plugin_files_impl(self, user_id: str, target_dir: Path, update: bool = False) -> Dict[str, Any]:
@@ -282,80 +554,92 @@ class OpenAILifecycleManager(BaseLifecycleManager):
         Copies all files from the plugin source directory to the target directory.
         """
         try:
-            source_dir = Path(__file__).parent
+            source_dir = _HERE
             copied_files = []
-
-            # Define files and directories to exclude (similar to build_archive.py)
-            exclude_patterns = {
-                'node_modules',
-                'package-lock.json',
-                '.git',
-                '.gitignore',
-                '__pycache__',
-                '*.pyc',
-                '.DS_Store',
-                'Thumbs.db'
-            }
-
-            def should_copy(path: Path) -> bool:
-                """Check if a file/directory should be copied"""
-                # Check if any part of the path matches exclude patterns
-                for part in path.parts:
-                    if part in exclude_patterns:
-                        return False
-                # Check for pattern matches
-                for pattern in exclude_patterns:
-                    if '*' in pattern and path.name.endswith(pattern.replace('*', '')):
-                        return False
-                return True
-
-            # Copy all files and directories recursively
-            for item in source_dir.rglob('*'):
-                # Skip the lifecycle_manager.py file itself to avoid infinite recursion
-                if item.name == 'lifecycle_manager.py' and item == Path(__file__):
-                    continue
-
-                # Get relative path from source directory
-                relative_path = item.relative_to(source_dir)
-
-                # Check if we should copy this item
-                if not should_copy(relative_path):
-                    continue
-
-                target_path = target_dir / relative_path
-
-                try:
-                    if item.is_file():
-                        # Create parent directories if they don't exist
-                        target_path.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(item, target_path)
-                        copied_files.append(str(target_path))
-                        logger.info(f"OpenAIPlugin: Copied file {item} to {target_path}")
-                    elif item.is_dir():
-                        # Create directory if it doesn't exist
-                        target_path.mkdir(parents=True, exist_ok=True)
-                        logger.info(f"OpenAIPlugin: Created directory {target_path}")
-                except Exception as e:
-                    logger.error(f"OpenAIPlugin: Failed to copy {item} to {target_path}: {e}")
-                    continue
-
-            # Copy the lifecycle_manager.py file itself
-            lifecycle_manager_source = Path(__file__)
-            lifecycle_manager_target = target_dir / 'lifecycle_manager.py'
+            unchanged_files = []
+            failed_files = []
+
+            def copy_file(src: str, dst: str) -> str:
+                if _copy_if_changed(src, dst):
+                    self.log.debug("copied_file", src=src, dst=dst)
+                    copied_files.append(dst)
+                else:
+                    self.log.debug("skipped_unchanged_file", src=src, dst=dst)
+                    unchanged_files.append(dst)
+                return dst
+
+            # copytree walks with os.scandir and never enters ignored directories;
+            # run it in a worker thread so the event loop is not blocked
             try:
-                shutil.copy2(lifecycle_manager_source, lifecycle_manager_target)
-                copied_files.append(str(lifecycle_manager_target))
-                logger.info(f"OpenAIPlugin: Copied lifecycle_manager.py to {lifecycle_manager_target}")
-            except Exception as e:
-                logger.error(f"OpenAIPlugin: Failed to copy lifecycle_manager.py: {e}")
-
-            logger.info(f"OpenAIPlugin: Copied {len(copied_files)} files/directories to {target_dir}")
-            return {'success': True, 'copied_files': copied_files}
+                await asyncio.to_thread(
+                    shutil.copytree,
+                    source_dir,
+                    target_dir,
+                    ignore=self._ignore_excluded,
+                    copy_function=copy_file,
+                    # Dangling symlinks in the source are skipped, as the old walk did
+                    ignore_dangling_symlinks=True,
+                    dirs_exist_ok=True
+                )
+            except shutil.Error as e:
+                # copytree copies everything it can and reports failures at the end.
+                # A partially copied bundle cannot be served, so any per-file
+                # failure fails the copy (and install_plugin rolls back the user).
+                for src, dst, error in e.args[0]:
+                    self.log.error("copy_failed", src=src, dst=dst, error=error)
+                    failed_files.append(src)
+
+            self.log.info(
+                "plugin_files_copied",
+                count=len(copied_files),
+                unchanged=len(unchanged_files),
+                failed=len(failed_files),
+                target_dir=str(target_dir)
+            )
+            result = {
+                'success': not failed_files,
+                'copied_files': copied_files,
+                'unchanged_files': unchanged_files
+            }
+            if failed_files:
+                result['error'] = f"Failed to copy {len(failed_files)} file(s)"
+                result['failed_files'] = failed_files
+            return result
 
         except Exception as e:
-            logger.error(f"OpenAIPlugin: Error copying plugin files: {e}")
+            self.log.error("plugin_files_copy_failed", error=str(e))
             return {'success': False, 'error': str(e)}
 
+    def _ignore_excluded(self, directory: str, names: list) -> set:
+        """shutil.copytree ignore callback returning the excluded names in a directory"""
+        ignored = set()
+        for name in names:
+            if name in self.EXCLUDE_EXACT or name.endswith(self.EXCLUDE_SUFFIXES):
+                ignored.add(name)
+            else:
+                path = os.path.join(directory, name)
+                # Never descend into symlinked directories (copytree would follow them)
+                if os.path.islink(path) and os.path.isdir(path):
+                    ignored.add(name)
+        return ignored
+
+    def _read_package_json(self, plugin_dir: Path) -> Dict[str, Any]:
+        """
+        Read and parse package.json from a plugin directory.
+        The parsed result is reused until the file's mtime or size changes.
+        """
+        package_json_path = plugin_dir / "package.json"
+        st = os.stat(package_json_path)
+        signature = (st.st_mtime_ns, st.st_size)
+
+        cached = self._package_json_cache.get(package_json_path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        package_data = _json_loads(package_json_path.read_bytes())
+        self._package_json_cache[package_json_path] = (signature, package_data)
+        return package_data
+
     async def _validate_installation_impl(self, user_id: str, plugin_dir: Path) -> Dict[str, Any]:
         """
         OpenAIPlugin-specific validation logic.
@@ -377,10 +661,8 @@ class OpenAILifecycleManager(BaseLifecycleManager):
                 }
 
             # Validate package.json structure
-            package_json_path = plugin_dir / "package.json"
             try:
-                with open(package_json_path, 'r') as f:
-                    package_data = json.load(f)
+                package_data = await asyncio.to_thread(self._read_package_json, plugin_dir)
 
                 # Check for required package.json fields
                 required_fields = ["name", "version"]
@@ -405,11 +687,11 @@ class OpenAILifecycleManager(BaseLifecycleManager):
                     'error': 'OpenAIPlugin: Bundle file (remoteEntry.js) is empty'
                 }
 
-            logger.info(f"OpenAIPlugin: Installation validation passed for user {user_id}")
+            self.log.info("installation_validated", user_id=user_id)
             return {'valid': True}
 
         except Exception as e:
-            logger.error(f"OpenAIPlugin: Error validating installation: {e}")
+            self.log.error("installation_validation_failed", user_id=user_id, error=str(e))
             return {'valid': False, 'error': str(e)}
 
     async def _get_plugin_health_impl(self, user_id: str, plugin_dir: Path) -> Dict[str, Any]:
@@ -417,34 +699,57 @@ class OpenAILifecycleManager(BaseLifecycleManager):
         OpenAIPlugin-specific health check logic.
         This method is called by the base class during status checks.
         """
+        poll = next(self._health_poll_counter)
         try:
             health_info = {
                 'bundle_exists': False,
                 'bundle_size': 0,
+                'bundle_digest': None,
                 'package_json_valid': False,
                 'assets_present': False
             }
 
-            # Check bundle file
             bundle_path = plugin_dir / "dist" / "remoteEntry.js"
-            if bundle_path.exists():
+            package_json_path = plugin_dir / "package.json"
+            assets_present = os.path.isdir(plugin_dir / "assets")
+
+            try:
+                bundle_stat = os.stat(bundle_path)
+            except OSError:
+                bundle_stat = None
+            try:
+                package_stat = os.stat(package_json_path)
+            except OSError:
+                package_stat = None
+
+            # Reuse the previous result while the plugin files are unchanged
+            cache_key = None
+            if bundle_stat is not None and package_stat is not None:
+                cache_key = (
+                    bundle_stat.st_mtime_ns, bundle_stat.st_size,
+                    package_stat.st_mtime_ns, package_stat.st_size,
+                    assets_present
+                )
+                cached = self._health_cache.get(plugin_dir)
+                if cached and cached[0] == cache_key:
+                    self._log_health_sample(poll, user_id, cached[1])
+                    return self._copy_health(cached[1])
+
+            # Check bundle file
+            if bundle_stat is not None:
                 health_info['bundle_exists'] = True
-                health_info['bundle_size'] = bundle_path.stat().st_size
+                health_info['bundle_size'] = bundle_stat.st_size
+                health_info['bundle_digest'] = await self._get_bundle_digest(bundle_path, bundle_stat)
 
             # Check package.json
-            package_json_path = plugin_dir / "package.json"
-            if package_json_path.exists():
-                try:
-                    with open(package_json_path, 'r') as f:
-                        json.load(f)
-                    health_info['package_json_valid'] = True
-                except json.JSONDecodeError:
-                    pass
+            try:
+                await asyncio.to_thread(self._read_package_json, plugin_dir)
+                health_info['package_json_valid'] = True
+            except (json.JSONDecodeError, FileNotFoundError):
+                pass
 
             # Check for assets directory
-            assets_path = plugin_dir / "assets"
-            if assets_path.exists() and assets_path.is_dir():
-                health_info['assets_present'] = True
+            health_info['assets_present'] = assets_present
 
             # Determine overall health
             is_healthy = (
@@ -453,35 +758,62 @@ class OpenAILifecycleManager(BaseLifecycleManager):
                 health_info['package_json_valid']
             )
 
-            return {
+            health = {
                 'healthy': is_healthy,
                 'details': health_info
             }
+            if cache_key is not None:
+                self._health_cache[plugin_dir] = (cache_key, health)
+            self._log_health_sample(poll, user_id, health)
+            return self._copy_health(health)
 
         except Exception as e:
-            logger.error(f"OpenAIPlugin: Error checking plugin health: {e}")
+            self.log.error("health_check_failed", user_id=user_id, error=str(e))
             return {
                 'healthy': False,
                 'details': {'error': str(e)}
             }
 
+    async def _get_bundle_digest(self, bundle_path: Path, bundle_stat: os.stat_result) -> str:
+        """Return the bundle's hex digest, rehashing only when its mtime or size changes"""
+        signature = (bundle_stat.st_mtime_ns, bundle_stat.st_size)
+        cached = self._bundle_digest_cache.get(bundle_path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        digest = (await asyncio.to_thread(_file_digest, bundle_path)).hex()
+        self._bundle_digest_cache[bundle_path] = (signature, digest)
+        return digest
+
+    @staticmethod
+    def _copy_health(health: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a cached health result so callers cannot mutate the cache"""
+        return {'healthy': health['healthy'], 'details': dict(health['details'])}
+
+    def _log_health_sample(self, poll: int, user_id: str, health: Dict[str, Any]) -> None:
+        """Log one in every HEALTH_LOG_SAMPLE_RATE health polls to keep polling cheap"""
+        if poll % self.HEALTH_LOG_SAMPLE_RATE == 0:
+            self.log.info("health_sample", poll=poll, user_id=user_id, healthy=health['healthy'], **health['details'])
+
     async def _check_existing_plugin(self, user_id: str, db: AsyncSession) -> Dict[str, Any]:
         """Check if plugin already exists for user"""
-        try:
-            plugin_query = text("""
-            SELECT id, name, version, enabled, created_at, updated_at
-            FROM plugin
-            WHERE user_id = :user_id AND plugin_slug = :plugin_slug
-            """)
+        cache_key = (user_id, self.plugin_data['plugin_slug'])
+        cached = self._exists_cache.get(cache_key)
+        if cached:
+            if time.monotonic() - cached[0] < self.EXISTS_CACHE_TTL:
+                self._exists_cache.move_to_end(cache_key)
+                return self._copy_existing(cached[1])
+            del self._exists_cache[cache_key]
 
-            result = await db.execute(plugin_query, {
+        try:
+            result = await db.execute(_PLUGIN_EXISTS_SELECT, {
                 'user_id': user_id,
                 'plugin_slug': self.plugin_data['plugin_slug']
             })
 
             plugin_row = result.fetchone()
             if plugin_row:
-                return {
+                existing = {
                     'exists': True,
                     'plugin_id': plugin_row.id,
                     'plugin_info': {
@@ -494,37 +826,34 @@ class OpenAILifecycleManager(BaseLifecycleManager):
                     }
                 }
             else:
-                return {'exists': False}
+                existing = {'exists': False}
+
+            self._exists_cache[cache_key] = (time.monotonic(), existing)
+            self._exists_cache.move_to_end(cache_key)
+            while len(self._exists_cache) > self.EXISTS_CACHE_MAX_ENTRIES:
+                self._exists_cache.popitem(last=False)
+            return self._copy_existing(existing)
 
         except Exception as e:
-            logger.error(f"Error checking existing plugin: {e}")
+            self.log.error("existing_plugin_check_failed", user_id=user_id, error=str(e))
             return {'exists': False, 'error': str(e)}
 
+    @staticmethod
+    def _copy_existing(existing: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a cached _check_existing_plugin result so callers cannot mutate the cache"""
+        if 'plugin_info' not in existing:
+            return dict(existing)
+        return {**existing, 'plugin_info': dict(existing['plugin_info'])}
+
     async def _create_database_records(self, user_id: str, db: AsyncSession) -> Dict[str, Any]:
         """Create plugin and module records in database"""
         try:
-            current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            # isoformat yields the same "YYYY-MM-DD HH:MM:SS" text as strftime at lower cost
+            current_time = datetime.datetime.now().isoformat(sep=' ', timespec='seconds')
             plugin_slug = self.plugin_data['plugin_slug']
             plugin_id = f"{user_id}_{plugin_slug}"
 
-            plugin_stmt = text("""
-            INSERT INTO plugin
-            (id, name, description, version, type, enabled, icon, category, status,
-            official, author, last_updated, compatibility, downloads, scope,
-            bundle_method, bundle_location, is_local, long_description,
-            config_fields, messages, dependencies, created_at, updated_at, user_id,
-            plugin_slug, source_type, source_url, update_check_url, last_update_check,
-            update_available, latest_version, installation_type, permissions)
-            VALUES
-            (:id, :name, :description, :version, :type, :enabled, :icon, :category,
-            :status, :official, :author, :last_updated, :compatibility, :downloads,
-            :scope, :bundle_method, :bundle_location, :is_local, :long_description,
-            :config_fields, :messages, :dependencies, :created_at, :updated_at, :user_id,
-            :plugin_slug, :source_type, :source_url, :update_check_url, :last_update_check,
-            :update_available, :latest_version, :installation_type, :permissions)
-            """)
-
-            await db.execute(plugin_stmt, {
+            await db.execute(_PLUGIN_INSERT, {
                 'id': plugin_id,
                 'name': self.plugin_data['name'],
                 'description': self.plugin_data['description'],
@@ -544,7 +873,7 @@ class OpenAILifecycleManager(BaseLifecycleManager):
                 'bundle_location': self.plugin_data['bundle_location'],
                 'is_local': self.plugin_data['is_local'],
                 'long_description': self.plugin_data['long_description'],
-                'config_fields': json.dumps({}),
+                'config_fields': _json_dumps({}),
                 'messages': None,
                 'dependencies': None,
                 'created_at': current_time,
@@ -558,26 +887,13 @@ class OpenAILifecycleManager(BaseLifecycleManager):
                 'update_available': self.plugin_data['update_available'],
                 'latest_version': self.plugin_data['latest_version'],
                 'installation_type': self.plugin_data['installation_type'],
-                'permissions': json.dumps(self.plugin_data['permissions'])
+                'permissions': self._permissions_json
             })
 
-            modules_created = []
-            for module_data in self.module_data:
-                module_id = f"{user_id}_{plugin_slug}_{module_data['name']}"
-
-                module_stmt = text("""
-                INSERT INTO module
-                (id, plugin_id, name, display_name, description, icon, category,
-                enabled, priority, props, config_fields, messages, required_services,
-                dependencies, layout, tags, created_at, updated_at, user_id)
-                VALUES
-                (:id, :plugin_id, :name, :display_name, :description, :icon, :category,
-                :enabled, :priority, :props, :config_fields, :messages, :required_services,
-                :dependencies, :layout, :tags, :created_at, :updated_at, :user_id)
-                """)
-
-                await db.execute(module_stmt, {
-                    'id': module_id,
+            # Bind all modules in one executemany instead of awaiting per module
+            module_params = [
+                {
+                    'id': f"{user_id}_{plugin_slug}_{module_data['name']}",
                     'plugin_id': plugin_id,
                     'name': module_data['name'],
                     'display_name': module_data['display_name'],
@@ -586,28 +902,33 @@ class OpenAILifecycleManager(BaseLifecycleManager):
                     'category': module_data['category'],
                     'enabled': True,
                     'priority': module_data['priority'],
-                    'props': json.dumps(module_data['props']),
-                    'config_fields': json.dumps(module_data['config_fields']),
-                    'messages': json.dumps(module_data['messages']),
-                    'required_services': json.dumps(module_data['required_services']),
-                    'dependencies': json.dumps(module_data['dependencies']),
-                    'layout': json.dumps(module_data['layout']),
-                    'tags': json.dumps(module_data['tags']),
+                    'props': module_data['props_json'],
+                    'config_fields': module_data['config_fields_json'],
+                    'messages': module_data['messages_json'],
+                    'required_services': module_data['required_services_json'],
+                    'dependencies': module_data['dependencies_json'],
+                    'layout': module_data['layout_json'],
+                    'tags': module_data['tags_json'],
                     'created_at': current_time,
                     'updated_at': current_time,
                     'user_id': user_id
-                })
+                }
+                for module_data in self._module_serialized
+            ]
+            modules_created = [params['id'] for params in module_params]
 
-                modules_created.append(module_id)
+            if module_params:
+                await db.execute(_MODULE_INSERT, module_params)
 
             # Commit the transaction to persist changes
             await db.commit()
+            self._exists_cache.pop((user_id, plugin_slug), None)
 
-            logger.info(f"Created database records for plugin {plugin_id} with {len(modules_created)} modules")
+            self.log.info("database_records_created", plugin_id=plugin_id, modules=len(modules_created))
             return {'success': True, 'plugin_id': plugin_id, 'modules_created': modules_created}
 
         except Exception as e:
-            logger.error(f"Error creating database records: {e}")
+            self.log.error("database_records_create_failed", user_id=user_id, error=str(e))
             # Rollback on error
             await db.rollback()
             return {'success': False, 'error': str(e)}
@@ -615,43 +936,100 @@ class OpenAILifecycleManager(BaseLifecycleManager):
     async def _delete_database_records(self, user_id: str, plugin_id: str, db: AsyncSession) -> Dict[str, Any]:
         """Delete plugin and module records from database"""
         try:
-            module_delete_stmt = text("""
-            DELETE FROM module
-            WHERE plugin_id = :plugin_id AND user_id = :user_id
-            """)
-
-            module_result = await db.execute(module_delete_stmt, {
+            params = {
                 'plugin_id': plugin_id,
                 'user_id': user_id
-            })
+            }
 
+            # PostgreSQL uninstalls use _delete_user_plugin_records instead
+            module_result = await db.execute(_MODULE_DELETE, params)
             deleted_modules = module_result.rowcount
 
-            plugin_delete_stmt = text("""
-            DELETE FROM plugin
-            WHERE id = :plugin_id AND user_id = :user_id
-            """)
-
-            plugin_result = await db.execute(plugin_delete_stmt, {
-                'plugin_id': plugin_id,
-                'user_id': user_id
-            })
+            plugin_result = await db.execute(_PLUGIN_DELETE, params)
+            deleted_plugins = plugin_result.rowcount
 
-            if plugin_result.rowcount == 0:
+            # Whether or not anything was deleted, a cached 'exists' is now stale
+            self._exists_cache.pop((user_id, self.plugin_data['plugin_slug']), None)
+            if deleted_plugins == 0:
                 return {'success': False, 'error': 'Plugin not found or not owned by user'}
 
             # Commit the transaction to persist changes
             await db.commit()
 
-            logger.info(f"Deleted database records for plugin {plugin_id} ({deleted_modules} modules)")
+            self.log.info("database_records_deleted", plugin_id=plugin_id, modules=deleted_modules)
             return {'success': True, 'deleted_modules': deleted_modules}
 
         except Exception as e:
-            logger.error(f"Error deleting database records: {e}")
+            self.log.error("database_records_delete_failed", plugin_id=plugin_id, error=str(e))
+            # Rollback on error
+            await db.rollback()
+            return {'success': False, 'error': str(e)}
+
+    async def _delete_user_plugin_records(self, user_id: str, db: AsyncSession) -> Dict[str, Any]:
+        """
+        Delete the user's plugin and module records by plugin slug in a single
+        PostgreSQL statement, returning the deleted plugin id.
+        """
+        plugin_slug = self.plugin_data['plugin_slug']
+        try:
+            result = await db.execute(_USER_PLUGIN_DELETE_RETURNING, {
+                'user_id': user_id,
+                'plugin_slug': plugin_slug
+            })
+
+            row = result.fetchone()
+            self._exists_cache.pop((user_id, plugin_slug), None)
+            if row is None:
+                return {'success': False, 'error': 'Plugin not found for user'}
+
+            # Commit the transaction to persist changes
+            await db.commit()
+
+            self.log.info("database_records_deleted", plugin_id=row.id, modules=row.deleted_modules)
+            return {'success': True, 'plugin_id': row.id, 'deleted_modules': row.deleted_modules}
+
+        except Exception as e:
+            self.log.error("database_records_delete_failed", user_id=user_id, error=str(e))
             # Rollback on error
             await db.rollback()
             return {'success': False, 'error': str(e)}
 
+    @classmethod
+    def configure_engine(cls, url: str, **engine_kwargs):
+        """
+        Create an async engine suitable for the sessions passed to this manager.
+        PostgreSQL URLs without an async driver are switched to the native
+        asyncpg driver, and PostgreSQL engines are given a tuned connection
+        pool; keyword arguments override the defaults.
+        """
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        engine_url = cls._engine_url(url)
+        if engine_url.get_backend_name() == 'postgresql':
+            engine_kwargs = {**cls.ENGINE_POOL_DEFAULTS, **engine_kwargs}
+
+        return create_async_engine(engine_url, **engine_kwargs)
+
+    @classmethod
+    def _engine_url(cls, url: str):
+        """Parse a database URL, switching non-async PostgreSQL drivers to asyncpg"""
+        engine_url = make_url(url)
+        # Only an explicitly named driver counts; the implied default varies by
+        # SQLAlchemy version
+        explicit_driver = engine_url.drivername.partition('+')[2]
+        if (engine_url.get_backend_name() == 'postgresql'
+                and explicit_driver not in cls.ASYNC_POSTGRESQL_DRIVERS):
+            engine_url = engine_url.set(drivername='postgresql+asyncpg')
+        return engine_url
+
+    @staticmethod
+    def _dialect_name(db: AsyncSession) -> Optional[str]:
+        """Return the SQL dialect name of the session's bind, if it can be determined"""
+        try:
+            return db.get_bind().dialect.name
+        except Exception:
+            return None
+
     async def _export_user_data(self, user_id: str, db: AsyncSession) -> Dict[str, Any]:
         """Export user-specific data for migration during updates"""
         try:
@@ -665,118 +1043,66 @@ class OpenAILifecycleManager(BaseLifecycleManager):
                 'module_configs': {}
             }
 
-            # Export user-specific plugin configuration
-            from sqlalchemy import text
-            plugin_query = text("""
-            SELECT config_fields FROM plugin
-            WHERE user_id = :user_id AND plugin_slug = :plugin_slug
-            """)
-
-            result = await db.execute(plugin_query, {
+            # Export plugin and module configurations in one round-trip
+            result = await db.execute(_USER_CONFIG_EXPORT, {
                 'user_id': user_id,
                 'plugin_slug': self.plugin_data['plugin_slug']
             })
 
-            plugin_row = result.fetchone()
-            if plugin_row and plugin_row.config_fields:
-                try:
-                    import json
-                    user_data['user_config'] = json.loads(plugin_row.config_fields)
-                except (json.JSONDecodeError, TypeError):
-                    user_data['user_config'] = {}
-
-            # Export module-specific configurations
-            module_query = text("""
-            SELECT name, config_fields FROM module
-            WHERE plugin_id = :plugin_id AND user_id = :user_id
-            """)
-
-            plugin_id = f"{user_id}_{self.plugin_data['plugin_slug']}"
-            result = await db.execute(module_query, {
-                'plugin_id': plugin_id,
-                'user_id': user_id
-            })
+            # Every row repeats the plugin config; module columns are NULL
+            # when the plugin has no modules
+            rows = result.fetchall()
+            if rows and rows[0].plugin_config:
+                user_data['user_config'] = _load_config_field(rows[0].plugin_config)
 
-            modules = result.fetchall()
-            for module in modules:
-                if module.config_fields:
-                    try:
-                        import json
-                        user_data['module_configs'][module.name] = json.loads(module.config_fields)
-                    except (json.JSONDecodeError, TypeError):
-                        user_data['module_configs'][module.name] = {}
+            for row in rows:
+                if row.module_name is not None and row.module_config:
+                    user_data['module_configs'][row.module_name] = _load_config_field(row.module_config)
 
-            logger.info(f"OpenAIPlugin: Exported user data for {user_id} during update")
+            self.log.info("user_data_exported", user_id=user_id)
             return user_data
 
         except Exception as e:
-            logger.error(f"OpenAIPlugin: Error exporting user data for {user_id}: {e}")
+            self.log.error("user_data_export_failed", user_id=user_id, error=str(e))
             # Return minimal data to allow update to continue
-            return {
-                'shared_plugin_path': self.shared_path,
-                'user_id': user_id,
-                'plugin_slug': self.plugin_slug,
-                'version': self.version,
-                'user_config': {},
-                'module_configs': {}
-            }
+            return {**self._fallback_export_template, 'user_id': user_id, 'user_config': {}, 'module_configs': {}}
 
     async def _import_user_data(self, user_id: str, db: AsyncSession, user_data: Dict[str, Any]):
         """Import user-specific data after migration during updates"""
         try:
             # Import user plugin configuration
             if user_data.get('user_config'):
-                from sqlalchemy import text
-                import json
-
                 plugin_id = f"{user_id}_{self.plugin_data['plugin_slug']}"
-                update_plugin_query = text("""
-                UPDATE plugin SET config_fields = :config_fields
-                WHERE id = :plugin_id AND user_id = :user_id
-                """)
-
-                await db.execute(update_plugin_query, {
-                    'config_fields': json.dumps(user_data['user_config']),
+                await db.execute(_PLUGIN_CONFIG_UPDATE, {
+                    'config_fields': _json_dumps_config(user_data['user_config']),
                     'plugin_id': plugin_id,
                     'user_id': user_id
                 })
 
-            # Import module configurations
+            # Import module configurations in a single executemany
             if user_data.get('module_configs'):
-                from sqlalchemy import text
-                import json
-
-                for module_name, module_config in user_data['module_configs'].items():
-                    module_id = f"{user_id}_{self.plugin_data['plugin_slug']}_{module_name}"
-                    update_module_query = text("""
-                    UPDATE module SET config_fields = :config_fields
-                    WHERE id = :module_id AND user_id = :user_id
-                    """)
-
-                    await db.execute(update_module_query, {
-                        'config_fields': json.dumps(module_config),
-                        'module_id': module_id,
+                plugin_slug = self.plugin_data['plugin_slug']
+                module_params = [
+                    {
+                        'config_fields': _json_dumps_config(module_config),
+                        'module_id': f"{user_id}_{plugin_slug}_{module_name}",
                         'user_id': user_id
-                    })
+                    }
+                    for module_name, module_config in user_data['module_configs'].items()
+                ]
+
+                await db.execute(_MODULE_CONFIG_UPDATE, module_params)
 
-            logger.info(f"OpenAIPlugin: Imported user data for {user_id} after update")
+            self.log.info("user_data_imported", user_id=user_id)
 
         except Exception as e:
-            logger.error(f"OpenAIPlugin: Error importing user data for {user_id}: {e}")
+            self.log.error("user_data_import_failed", user_id=user_id, error=str(e))
             # Don't fail the update if data import fails
             pass
 
     def get_plugin_info(self) -> Dict[str, Any]:
         """Get basic plugin information"""
-        return {
-            'name': self.plugin_data['name'],
-            'version': self.plugin_data['version'],
-            'description': self.plugin_data['description'],
-            'author': self.plugin_data['author'],
-            'plugin_slug': self.plugin_data['plugin_slug'],
-            'type': self.plugin_data['type'],
-            'category': self.plugin_data['category']
-        }
+        return dict(self._plugin_info)
 
     # Compatibility property for remote installer
     @property
@@ -792,17 +1118,26 @@ class OpenAILifecycleManager(BaseLifecycleManager):
             shared_path = self.shared_path
             shared_path.mkdir(parents=True, exist_ok=True)
 
-            # Copy files to shared path for testing
-            copy_result = await self._copy_plugin_files_impl(user_id, shared_path)
+            # Copy files to shared path and create the user's records concurrently;
+            # the file copy runs in worker threads while the inserts await the database
+            copy_result, result = await asyncio.gather(
+                self._copy_plugin_files_impl(user_id, shared_path),
+                self.install_for_user(user_id, db, shared_path)
+            )
+
             if not copy_result['success']:
+                # Undo the user installation so a failed copy leaves nothing behind
+                if result.get('success'):
+                    rollback_result = await self.uninstall_for_user(user_id, db)
+                    if not rollback_result.get('success'):
+                        self.log.error("install_rollback_failed", user_id=user_id, error=rollback_result.get('error'))
+                        return {**copy_result, 'rollback_error': rollback_result.get('error', 'Unknown error')}
                 return copy_result
 
-            # Use the new architecture method
-            result = await self.install_for_user(user_id, db, shared_path)
             return result
 
         except Exception as e:
-            logger.error(f"Plugin installation failed for user {user_id}: {e}")
+            self.log.error("plugin_install_failed", user_id=user_id, error=str(e))
             return {'success': False, 'error': str(e)}
 
     async def delete_plugin(self, user_id: str, db: AsyncSession) -> Dict[str, Any]:
@@ -813,7 +1148,7 @@ class OpenAILifecycleManager(BaseLifecycleManager):
             return result
 
         except Exception as e:
-            logger.error(f"Plugin deletion failed for user {user_id}: {e}")
+            self.log.error("plugin_delete_failed", user_id=user_id, error=str(e))
             return {'success': False, 'error': str(e)}
 
     async def get_plugin_status(self, user_id: str, db: AsyncSession) -> Dict[str, Any]:
@@ -838,7 +1173,7 @@ class OpenAILifecycleManager(BaseLifecycleManager):
             }
 
         except Exception as e:
-            logger.error(f"Error checking plugin status for user {user_id}: {e}")
+            self.log.error("plugin_status_check_failed", user_id=user_id, error=str(e))
             return {'exists': False, 'status': 'error', 'error': str(e)}
 
     async def update_plugin(self, user_id: str, db: AsyncSession, new_version_manager: 'OpenAILifecycleManager') -> Dict[str, Any]:
@@ -849,35 +1184,39 @@ class OpenAILifecycleManager(BaseLifecycleManager):
             return result
 
         except Exception as e:
-            logger.error(f"Plugin update failed for user {user_id}: {e}")
+            self.log.error("plugin_update_failed", user_id=user_id, error=str(e))
             return {'success': False, 'error': str(e)}
 
 
 # Compatibility functions for direct script usage
+@functools.lru_cache(maxsize=8)
+def _get_manager(plugins_base_dir: Optional[str] = None) -> OpenAILifecycleManager:
+    """Return the shared manager for a plugins directory; sessions are passed per call"""
+    return OpenAILifecycleManager(plugins_base_dir)
+
 async def install_plugin(user_id: str, db: AsyncSession, plugins_base_dir: str = None) -> Dict[str, Any]:
     """Install OpenAIPlugin plugin for specific user"""
-    manager = OpenAILifecycleManager(plugins_base_dir)
+    manager = _get_manager(plugins_base_dir)
     return await manager.install_plugin(user_id, db)
 
 async def delete_plugin(user_id: str, db: AsyncSession, plugins_base_dir: str = None) -> Dict[str, Any]:
     """Delete OpenAIPlugin plugin for user"""
-    manager = OpenAILifecycleManager(plugins_base_dir)
+    manager = _get_manager(plugins_base_dir)
     return await manager.delete_plugin(user_id, db)
 
 async def get_plugin_status(user_id: str, db: AsyncSession, plugins_base_dir: str = None) -> Dict[str, Any]:
     """Get current status of OpenAIPlugin plugin installation"""
-    manager = OpenAILifecycleManager(plugins_base_dir)
+    manager = _get_manager(plugins_base_dir)
     return await manager.get_plugin_status(user_id, db)
 
 async def update_plugin(user_id: str, db: AsyncSession, new_version_manager: 'OpenAILifecycleManager', plugins_base_dir: str = None) -> Dict[str, Any]:
     """Update OpenAIPlugin plugin for user"""
-    current_manager = OpenAILifecycleManager(plugins_base_dir)
+    current_manager = _get_manager(plugins_base_dir)
     return await current_manager.update_plugin(user_id, db, new_version_manager)
 
 
 if __name__ == "__main__":
     import sys
-    import asyncio
 
     async def main():
         if len(sys.argv) < 3: